@@ -250,5 +250,23 @@ namespace Odoo.Demo.Commands
         public int Counter { get; set; } = 0;
         public DateTime Timestamp { get; set; } = DateTime.Now;
         public bool IsProcessed { get; set; } = false;
+
+        /// <summary>
+        /// Set all properties in one call, so Python callers cross into .NET once
+        /// instead of once per property. The timestamp is taken on the .NET side.
+        /// </summary>
+        public void Apply(string message, int counter, bool isProcessed) =>
+            Apply(message, counter, isProcessed, DateTime.Now);
+
+        /// <summary>
+        /// Set all properties in one call with a caller-supplied timestamp.
+        /// </summary>
+        public void Apply(string message, int counter, bool isProcessed, DateTime timestamp)
+        {
+            Message = message;
+            Counter = counter;
+            IsProcessed = isProcessed;
+            Timestamp = timestamp;
+        }
     }
 }
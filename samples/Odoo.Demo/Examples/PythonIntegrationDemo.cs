@@ -76,30 +76,32 @@ namespace Odoo.Examples
 
                 // 6. Execute Python workflow
                 Console.WriteLine("4. Executing partner approval workflow:");
-                var workflowResult = moduleLoader.CallFunction<dynamic>(
+                // Workflow and batch results are namedtuples; keep them as
+                // PyObject so fields can be read by name.
+                dynamic workflowResult = moduleLoader.CallFunction<PyObject>(
                     "odoo_module_sample",
                     "partner_approval_workflow",
                     env,
                     10,
                     "approve"
                 );
-                Console.WriteLine($"   Partner ID: {workflowResult["partner_id"]}");
-                Console.WriteLine($"   Action: {workflowResult["action"]}");
-                Console.WriteLine($"   New State: {workflowResult["new_state"]}");
-                Console.WriteLine($"   Success: {workflowResult["success"]}\n");
+                Console.WriteLine($"   Partner ID: {workflowResult.partner_id}");
+                Console.WriteLine($"   Action: {workflowResult.action}");
+                Console.WriteLine($"   New State: {workflowResult.new_state}");
+                Console.WriteLine($"   Success: {workflowResult.success}\n");
 
                 // 7. Batch processing with Python
                 Console.WriteLine("5. Processing partner batch with Python:");
-                var batchResult = moduleLoader.CallFunction<dynamic>(
+                dynamic batchResult = moduleLoader.CallFunction<PyObject>(
                     "odoo_module_sample",
                     "process_partner_batch",
                     env,
                     new[] { 10, 11, 12 },
                     "validate"
                 );
-                Console.WriteLine($"   Processed: {batchResult["processed"]} partners");
-                Console.WriteLine($"   Operation: {batchResult["operation"]}");
-                Console.WriteLine($"   Success: {batchResult["success"]}\n");
+                Console.WriteLine($"   Processed: {batchResult.processed} partners");
+                Console.WriteLine($"   Operation: {batchResult.operation}");
+                Console.WriteLine($"   Success: {batchResult.success}\n");
 
                 // 8. Use Python extension methods
                 Console.WriteLine("6. Using Python extension methods:");
@@ -3,6 +3,18 @@ Sample Python module for Odoo ORM integration.
 This demonstrates how Python code can extend the C# ORM functionality.
 """
 
+import re
+from collections import namedtuple
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from types import MappingProxyType, SimpleNamespace
+
+
+@lru_cache(maxsize=8192)
+def _format_partner_display_name(partner_id):
+    return f"Partner #{partner_id}"
+
+
 def compute_partner_display_name(env, partner_id):
     """
     Compute a display name for a partner.
@@ -16,8 +28,21 @@ def compute_partner_display_name(env, partner_id):
         str: The computed display name
     """
     # In a real implementation, we would access the partner record
-    # through the environment and compute based on its fields
-    return f"Partner #{partner_id}"
+    # through the environment and compute based on its fields.
+    # The environment does not affect the result, so only the ID is cached.
+    return _format_partner_display_name(partner_id)
+
+
+# Validation rules as (getter, predicate) pairs. Getters are built once here
+# so validating a record does not look attributes up by name on every call.
+_PARTNER_RULES = tuple(
+    (attrgetter(field), predicate)
+    for field, predicate in (
+        ('Name', bool),
+        ('Email', lambda email: not email or '@' in email),
+        ('CountryId', lambda country_id: country_id is None or country_id > 0),
+    )
+)
 
 
 def validate_partner_data(record):
@@ -30,9 +55,7 @@ def validate_partner_data(record):
     Returns:
         bool: True if valid, False otherwise
     """
-    # Example validation logic
-    # In a real implementation, we would access record properties
-    return True
+    return all(predicate(getter(record)) for getter, predicate in _PARTNER_RULES)
 
 
 def get_partner_domain_filter(criteria):
@@ -59,6 +82,87 @@ def get_partner_domain_filter(criteria):
     return domain
 
 
+@lru_cache(maxsize=256)
+def _ilike_regex(value):
+    """
+    Translate an SQL ILIKE operand into an equivalent compiled regex.
+    
+    Cached so predicates built repeatedly for the same search text (e.g. as a
+    user refines a search) skip the translation and re.compile().
+    """
+    # ilike matches anywhere in the value; '%' and '_' keep their SQL meaning
+    pattern = ''.join(
+        '.*' if char == '%' else '.' if char == '_' else re.escape(char)
+        for char in str(value)
+    )
+    return re.compile(pattern, re.IGNORECASE | re.DOTALL)
+
+
+def _compile_eq(getter, value):
+    return lambda record: getter(record) == value
+
+
+def _compile_ilike(getter, value):
+    search = _ilike_regex(value).search
+    return lambda record: search(getter(record) or '') is not None
+
+
+# Leaf compilers per domain operator, with a relative evaluation cost used to
+# run cheap, selective checks before expensive ones.
+_LEAF_COMPILERS = {
+    '=': (0, _compile_eq),
+    'ilike': (1, _compile_ilike),
+}
+
+# Record attribute and operator per criteria key, for the same record shape
+# validate_partner_data uses.
+_PREDICATE_FIELDS = {
+    'is_company': ('IsCompany', '='),
+    'country': ('CountryId', '='),
+    'name': ('Name', 'ilike'),
+}
+
+
+def get_partner_domain_predicate(criteria):
+    """
+    Compile partner search criteria into a predicate over partner records.
+    
+    Use this instead of interpreting the domain from
+    get_partner_domain_filter() when filtering records in Python: every
+    leaf is resolved once here, including its regex for 'ilike', and
+    cheaper leaves are checked first.
+    
+    Args:
+        criteria: Dictionary of search criteria
+    
+    Returns:
+        callable: Takes a partner record and returns True if it matches
+    """
+    compiled = []
+    for key, (attribute, op) in _PREDICATE_FIELDS.items():
+        if key not in criteria:
+            continue
+        cost, compile_leaf = _LEAF_COMPILERS[op]
+        compiled.append((cost, compile_leaf(attrgetter(attribute), criteria[key])))
+    
+    checks = tuple(check for _cost, check in sorted(compiled, key=itemgetter(0)))
+    return lambda record: all(check(record) for check in checks)
+
+
+_DEFAULT_CREDIT_SCORE = 750
+
+# Batch operations, keyed by name. Each receives the full ID sequence in one
+# call, so a vectorized kernel can replace any of them without changing
+# process_partner_batch.
+_BATCH_OPERATIONS = MappingProxyType({
+    'validate': lambda ids: [partner_id > 0 for partner_id in ids],
+    'score': lambda ids: [_DEFAULT_CREDIT_SCORE] * len(ids)
+})
+
+
+BatchResult = namedtuple('BatchResult', 'processed success operation result')
+
+
 def process_partner_batch(env, partner_ids, operation):
     """
     Process a batch of partners with a custom operation.
@@ -69,57 +173,81 @@ def process_partner_batch(env, partner_ids, operation):
         operation: The operation to perform
     
     Returns:
-        dict: Results of the operation
+        BatchResult: Results of the operation, with one 'result' entry per
+        partner. Use _asdict() where a dict is needed.
     """
-    results = {
-        'processed': len(partner_ids),
-        'success': True,
-        'operation': operation
-    }
-    
-    # In a real implementation, we would iterate through partners
-    # and perform the operation
+    # Materialize the IDs once; a .NET array passed from C# would otherwise
+    # be marshalled again on every access.
+    ids = tuple(partner_ids)
+    kernel = _BATCH_OPERATIONS.get(operation)
     
-    return results
+    return BatchResult(
+        processed=len(ids),
+        success=kernel is not None,
+        operation=operation,
+        result=kernel(ids) if kernel is not None else None
+    )
 
 
-class PartnerExtension:
-    """
-    Python-based extension for Partner model.
-    This demonstrates how to add custom methods to models.
-    """
-    
-    @staticmethod
-    def send_welcome_email(env, partner_id):
-        """Send a welcome email to a partner."""
-        print(f"Sending welcome email to partner {partner_id}")
-        return True
-    
-    @staticmethod
-    def calculate_credit_score(env, partner_id):
-        """Calculate a credit score for a partner."""
-        # Placeholder implementation
-        return 750
-    
-    @staticmethod
-    def get_related_partners(env, partner_id, relation_type):
-        """Get partners related to this partner."""
-        # Placeholder - would return list of related partner IDs
-        return []
+# Python-based extension methods for the Partner model.
+# These are plain module functions; PartnerExtension groups them for callers
+# that look them up by namespace (e.g. PythonIntegrationDemo).
+def send_welcome_email(env, partner_id):
+    """Send a welcome email to a partner."""
+    print(f"Sending welcome email to partner {partner_id}")
+    return True
+
+
+def calculate_credit_score(env, partner_id):
+    """Calculate a credit score for a partner."""
+    # Placeholder implementation
+    return _DEFAULT_CREDIT_SCORE
+
+
+def get_related_partners(env, partner_id, relation_type):
+    """Get partners related to this partner."""
+    # Placeholder - would return list of related partner IDs
+    return []
+
+
+PartnerExtension = SimpleNamespace(
+    send_welcome_email=send_welcome_email,
+    calculate_credit_score=calculate_credit_score,
+    get_related_partners=get_related_partners
+)
+
+
+_format_display_name = "{} ({})".format
+_format_full_address = "{}, {}".format
+
+
+def _compute_display_name(columns):
+    """Compute display_name from the name and id columns in one pass."""
+    return list(map(_format_display_name, columns['name'], columns['id']))
+
+
+def _compute_full_address(columns):
+    """Compute full_address from the street and city columns in one pass."""
+    return list(map(_format_full_address, columns['street'], columns['city']))
 
 
 def create_computed_fields():
     """
     Return a dictionary of computed field definitions.
     This allows defining complex field computations in Python.
+    
+    Each 'compute_batch' function receives the 'depends' columns of all
+    records to recompute, as a mapping of field name to values, and returns
+    one value per record, in order. It never reads individual records, so
+    there is no per-record round trip into .NET.
     """
     return {
         'display_name': {
-            'compute': lambda record: f"{record.Name} ({record.Id})",
-            'depends': ['name']
+            'compute_batch': _compute_display_name,
+            'depends': ['name', 'id']
         },
         'full_address': {
-            'compute': lambda record: f"{record.Street}, {record.City}",
+            'compute_batch': _compute_full_address,
             'depends': ['street', 'city']
         }
     }
@@ -136,19 +264,8 @@ def partner_approval_workflow(env, partner_id, action):
         action: The workflow action ('approve', 'reject', 'review')
     
     Returns:
-        dict: Workflow result
+        WorkflowResult: Workflow result. Use _asdict() where a dict is needed.
     """
-    transitions = {
-        'approve': 'approved',
-        'reject': 'rejected',
-        'review': 'under_review'
-    }
-    
-    new_state = transitions.get(action)
+    new_state, success = _WF_OUTCOMES.get(action, _WF_UNKNOWN_OUTCOME)
     
-    return {
-        'partner_id': partner_id,
-        'action': action,
-        'new_state': new_state,
-        'success': new_state is not None
-    }
\ No newline at end of file
+    return WorkflowResult(partner_id, action, new_state, success)
\ No newline at end of file
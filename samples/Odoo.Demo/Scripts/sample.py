@@ -6,22 +6,36 @@ import sys
 
 import clr
 clr.AddReference("System")
-from System import Console, DateTime
+from System import Console
+
+_GREETING_CONSOLE_FMT = "Python calling .NET: Hello, %s!"
+_GREETING_FMT = "Greeting from Python: Welcome, %s!"
 
 def greet_from_python(name):
-    Console.WriteLine(f"Python calling .NET: Hello, {name}!")
-    return f"Greeting from Python: Welcome, {name}!"
+    # Nobody to greet on the console; skip the call into .NET
+    if not name:
+        return _GREETING_FMT % ("",)
+    Console.WriteLine(_GREETING_CONSOLE_FMT % (name,))
+    return _GREETING_FMT % (name,)
 
-def process_dotnet_object(dotnet_obj):
-    # Python accessing and modifying a passed .NET object
-    Console.WriteLine(f"Before modification - Message: {dotnet_obj.Message}, Counter: {dotnet_obj.Counter}, IsProcessed: {dotnet_obj.IsProcessed}")
-    
-    # Modify all properties
-    dotnet_obj.Message = "Modified by Python"
-    dotnet_obj.Counter = 42
-    dotnet_obj.Timestamp = DateTime.Now
-    dotnet_obj.IsProcessed = True
+_STATE_FMT = "%s modification - Message: %s, Counter: %s, IsProcessed: %s"
+
+def _log_state(stage, dotnet_obj):
+    # Each property read crosses into .NET, so read each one exactly once
+    message, counter, is_processed = dotnet_obj.Message, dotnet_obj.Counter, dotnet_obj.IsProcessed
+    Console.WriteLine(_STATE_FMT % (stage, message, counter, is_processed))
+    return message
+
+def process_dotnet_object(dotnet_obj, timestamp=None):
+    # Python accessing and modifying a passed .NET object.
+    # Pass timestamp to reuse one the caller already has instead of DateTime.Now.
+    _log_state("Before", dotnet_obj)
     
-    Console.WriteLine(f"After modification - Message: {dotnet_obj.Message}, Counter: {dotnet_obj.Counter}, IsProcessed: {dotnet_obj.IsProcessed}")
+    # Modify all properties in a single call into .NET; without a timestamp,
+    # Apply takes DateTime.Now on the .NET side
+    if timestamp is None:
+        dotnet_obj.Apply("Modified by Python", 42, True)
+    else:
+        dotnet_obj.Apply("Modified by Python", 42, True, timestamp)
     
-    return dotnet_obj.Message
\ No newline at end of file
+    return _log_state("After", dotnet_obj)
\ No newline at end of file
@@ -3,7 +3,9 @@
 Standalone test file for developing and debugging Python logic.
 
 This file can be run and debugged directly in VSCode with full debugger support.
-Once the logic works here, copy it to sample.py for use with .NET.
+It runs the real functions from sample.py against mock .NET types, so there
+is no second copy of the logic to keep in sync. It also checks the partner
+domain predicate from odoo_module_sample.py against mock partner records.
 
 Usage:
     python Scripts/sample_test.py
@@ -13,11 +15,18 @@ To debug in VSCode:
     2. Set breakpoints by clicking in the gutter
     3. Press F5 and select "Python Debugger"
     4. Step through code, inspect variables, etc.
+       (breakpoints set in sample.py are hit too)
 """
 
 import sys
+import types
 from datetime import datetime
 
+from odoo_module_sample import get_partner_domain_predicate
+
+_BANNER = "=" * 60
+_RULE = "-" * 40
+
 
 # Mock .NET types for testing
 class MockConsole:
@@ -28,10 +37,12 @@ class MockConsole:
 
 
 class MockDateTime:
-    """Mock System.DateTime for testing"""
-    @staticmethod
-    def Now():
-        return datetime.now()
+    """Mock System.DateTime for testing; run_tests() reads the clock once per run"""
+    _FROZEN = datetime(2024, 1, 1)
+
+    @classmethod
+    def Now(cls):
+        return cls._FROZEN
 
 
 class MockDotNetObject:
@@ -42,94 +53,103 @@ class MockDotNetObject:
         self.Timestamp = datetime.now()
         self.IsProcessed = False
     
+    def Apply(self, message, counter, is_processed, timestamp=None):
+        """Mirrors MessageContainer.Apply: set all properties in one call"""
+        self.Message = message
+        self.Counter = counter
+        self.IsProcessed = is_processed
+        self.Timestamp = MockDateTime.Now() if timestamp is None else timestamp
+    
     def __repr__(self):
         return (f"MockDotNetObject(Message='{self.Message}', "
                 f"Counter={self.Counter}, IsProcessed={self.IsProcessed})")
 
 
-# Test implementation of your Python functions
-def greet_from_python(name):
-    """
-    Test version of greet_from_python function.
-    Set breakpoint here to debug step-by-step.
-    """
-    Console = MockConsole()  # Use mock in tests
+class MockPartner:
+    """Mock partner record that logs which fields are read"""
+    def __init__(self, **fields):
+        self._fields = fields
+        self.reads = []
     
-    # Set breakpoint on next line to inspect 'name' parameter
-    Console.WriteLine(f"Python calling .NET: Hello, {name}!")
-    result = f"Greeting from Python: Welcome, {name}!"
-    
-    return result
+    def __getattr__(self, name):
+        self.reads.append(name)
+        return self._fields[name]
 
 
-def process_dotnet_object(dotnet_obj):
-    """
-    Test version of process_dotnet_object function.
-    Set breakpoint here to inspect object state changes.
+def _mock_module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    return module
+
+
+def _load_sample():
     """
-    Console = MockConsole()  # Use mock in tests
-    DateTime = MockDateTime()  # Use mock in tests
-    
-    # Set breakpoint here to inspect 'before' state
-    Console.WriteLine(
-        f"Before modification - Message: {dotnet_obj.Message}, "
-        f"Counter: {dotnet_obj.Counter}, IsProcessed: {dotnet_obj.IsProcessed}"
-    )
-    
-    # Modify all properties - set breakpoints to watch changes
-    dotnet_obj.Message = "Modified by Python"
-    dotnet_obj.Counter = 42
-    dotnet_obj.Timestamp = DateTime.Now()
-    dotnet_obj.IsProcessed = True
+    Import the real sample.py, with the mocks standing in for pythonnet's clr
+    and System modules unless the real ones are already loaded.
     
-    # Set breakpoint here to inspect 'after' state
-    Console.WriteLine(
-        f"After modification - Message: {dotnet_obj.Message}, "
-        f"Counter: {dotnet_obj.Counter}, IsProcessed: {dotnet_obj.IsProcessed}"
-    )
+    Only called when this file runs as a script, so importing sample_test
+    never replaces pythonnet's modules in a hosted interpreter.
+    """
+    if "clr" not in sys.modules:
+        sys.modules["clr"] = _mock_module("clr", AddReference=lambda assembly: None)
+        sys.modules["System"] = _mock_module("System", Console=MockConsole, DateTime=MockDateTime)
     
-    return dotnet_obj.Message
+    import sample
+    return sample
+
+
+def _check(condition, message):
+    """Fail the test run; unlike assert, this still runs under python -O."""
+    if not condition:
+        raise AssertionError(message)
 
 
-def run_tests():
-    """Run tests to verify function behavior"""
-    print("="* 60)
-    print("Testing Python Functions")
-    print("="* 60)
+def run_tests(sample):
+    """Run tests to verify the behavior of the given sample module"""
+    # Read the real clock once per run; every DateTime.Now() below reuses it
+    MockDateTime._FROZEN = datetime.now()
+    
+    print(f"{_BANNER}\nTesting Python Functions\n{_BANNER}")
     
     # Test 1: greet_from_python
     print("\n[TEST 1] Testing greet_from_python:")
-    print("-" * 40)
-    result = greet_from_python("TestUser")
+    print(_RULE)
+    result = sample.greet_from_python("TestUser")
     print(f"Returned: {result}")
-    assert "Welcome, TestUser" in result, "Failed: result doesn't contain expected text"
+    _check("Welcome, TestUser" in result, "Failed: result doesn't contain expected text")
     print("✓ Test passed!")
     
     # Test 2: process_dotnet_object
     print("\n[TEST 2] Testing process_dotnet_object:")
-    print("-" * 40)
+    print(_RULE)
     obj = MockDotNetObject()
     print(f"Before: {obj}")
     
-    returned_message = process_dotnet_object(obj)
+    returned_message = sample.process_dotnet_object(obj)
     
     print(f"After: {obj}")
     print(f"Returned message: {returned_message}")
     
     # Verify changes
-    assert obj.Message == "Modified by Python", "Failed: Message not modified"
-    assert obj.Counter == 42, "Failed: Counter not set to 42"
-    assert obj.IsProcessed == True, "Failed: IsProcessed not set to True"
-    assert returned_message == "Modified by Python", "Failed: returned wrong message"
+    _check(obj.Message == "Modified by Python", "Failed: Message not modified")
+    _check(obj.Counter == 42, "Failed: Counter not set to 42")
+    _check(obj.IsProcessed is True, "Failed: IsProcessed not set to True")
+    _check(returned_message == "Modified by Python", "Failed: returned wrong message")
+    
+    # A caller-supplied timestamp is written as-is instead of DateTime.Now
+    timestamp = datetime(2000, 1, 2, 3, 4, 5)
+    obj = MockDotNetObject()
+    sample.process_dotnet_object(obj, timestamp=timestamp)
+    _check(obj.Timestamp is timestamp, "Failed: explicit timestamp not used")
     print("✓ Test passed!")
     
     # Test 3: Edge cases
     print("\n[TEST 3] Testing edge cases:")
-    print("-" * 40)
+    print(_RULE)
     
     # Empty name
     try:
-        result = greet_from_python("")
+        result = sample.greet_from_python("")
         print(f"Empty name result: {result}")
         print("✓ Handles empty name")
     except Exception as e:
@@ -137,15 +157,37 @@ def run_tests():
     
     # Special characters in name
     try:
-        result = greet_from_python("User<>&\"'")
+        result = sample.greet_from_python("User<>&\"'")
         print(f"Special chars result: {result}")
         print("✓ Handles special characters")
     except Exception as e:
         print(f"✗ Failed with special chars: {e}")
     
-    print("\n" + "="* 60)
-    print("All tests completed!")
-    print("="* 60)
+    # Test 4: get_partner_domain_predicate
+    print("\n[TEST 4] Testing get_partner_domain_predicate:")
+    print(_RULE)
+    
+    # '%' and '_' are ILIKE wildcards; matching ignores case
+    matches = get_partner_domain_predicate({'name': 'ac%e co_op'})
+    _check(matches(MockPartner(Name="The ACME Co-op")), "Failed: wildcards not matched")
+    _check(not matches(MockPartner(Name="ACME Coop")), "Failed: '_' matched nothing")
+    
+    # Regex metacharacters in the name are literal
+    matches = get_partner_domain_predicate({'name': 'a.b (x)'})
+    _check(matches(MockPartner(Name="Shop a.b (x)")), "Failed: literal name not matched")
+    _check(not matches(MockPartner(Name="Shop axb x")), "Failed: '.' treated as regex")
+    
+    # A partner without a name does not match and does not raise
+    _check(not matches(MockPartner(Name=None)), "Failed: None name matched")
+    
+    # Cheap equality leaves run before the regex, which is then skipped
+    matches = get_partner_domain_predicate({'name': 'acme', 'is_company': True})
+    partner = MockPartner(Name="ACME", IsCompany=False)
+    _check(not matches(partner), "Failed: non-company matched")
+    _check(partner.reads == ['IsCompany'], "Failed: name read before is_company")
+    print("✓ Test passed!")
+    
+    print(f"\n{_BANNER}\nAll tests completed!\n{_BANNER}")
 
 
 if __name__ == "__main__":
@@ -153,15 +195,13 @@ if __name__ == "__main__":
     print(f"Script: {__file__}\n")
     
     # Run all tests
-    run_tests()
+    run_tests(_load_sample())
     
-    print("\n" + "="* 60)
-    print("DEBUGGING TIPS:")
-    print("="* 60)
+    print(f"\n{_BANNER}\nDEBUGGING TIPS:\n{_BANNER}")
     print("1. Set breakpoints by clicking in the gutter (left of line numbers)")
     print("2. Press F5 to start debugging")
     print("3. Use F10 to step over, F11 to step into functions")
     print("4. Hover over variables to see their values")
     print("5. Use the Debug Console to evaluate expressions")
-    print("6. Once working, copy functions to sample.py")
-    print("="* 60)
\ No newline at end of file
+    print("6. Fix bugs directly in sample.py; this script imports it")
+    print(_BANNER)
\ No newline at end of file